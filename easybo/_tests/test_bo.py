@@ -0,0 +1,113 @@
+from botorch.acquisition.objective import GenericMCObjective
+from botorch.sampling import SobolQMCNormalSampler
+import gpytorch
+import numpy as np
+import torch
+
+from easybo.bo import ask, _MaxVariance, _qMaxVariance
+from easybo.gp import EasySingleTaskGPRegressor
+from easybo.utils import get_dummy_1d_sinusoidal_data
+
+
+def _get_trained_model():
+    _, train_x, train_y = get_dummy_1d_sinusoidal_data()
+    model = EasySingleTaskGPRegressor(train_x=train_x, train_y=train_y)
+    model.train_()
+    return model
+
+
+def test_ask_qMaxVariance_X_pending():
+    """The MC-based max variance acquisition function can be built by name
+    and optimized jointly with pending points."""
+
+    model = _get_trained_model()
+    candidate = ask(
+        model=model,
+        bounds=[[0, 1]],
+        acquisition_function="qMaxVariance",
+        X_pending=np.array([[0.25], [0.75]]),
+    )
+    assert tuple(candidate.shape) == (1, 1)
+    assert 0.0 <= candidate.item() <= 1.0
+
+
+def test_qMaxVariance_sampler():
+    """The sample budget is passed on to the default sampler, and seeded
+    instances give identical acquisition values."""
+
+    model = _get_trained_model().model
+    aq = _qMaxVariance(model, num_samples=64)
+    assert aq.sampler.sample_shape == torch.Size([64])
+
+    X = torch.tensor([[0.1], [0.5], [0.9]]).unsqueeze(1)
+    X_pending = torch.tensor([[0.25], [0.75]])
+    values = []
+    for _ in range(2):
+        aq = _qMaxVariance(model, X_pending=X_pending, seed=0)
+        with torch.no_grad():
+            values.append(aq(X))
+    assert torch.equal(values[0], values[1])
+
+
+def _ask_max_variance(model, fast_pred_var):
+    torch.manual_seed(0)
+    candidate = ask(
+        model=model,
+        bounds=[[0, 1]],
+        acquisition_function="MaxVariance",
+        fast_pred_var=fast_pred_var,
+    )
+    with torch.no_grad(), gpytorch.settings.fast_pred_var(fast_pred_var):
+        value = _MaxVariance(model.model)(candidate)
+    return candidate, value
+
+
+def test_ask_fast_pred_var():
+    """With few training points, fast predictive variances are exact, so
+    ask returns the same candidate (of the right shape, within the bounds)
+    and acquisition value whether or not they are used."""
+
+    model = _get_trained_model()
+    fast_candidate, fast_value = _ask_max_variance(model, True)
+    candidate, value = _ask_max_variance(model, False)
+
+    assert tuple(candidate.shape) == (1, 1)
+    assert 0.0 <= candidate.item() <= 1.0
+    assert np.allclose(fast_candidate, candidate, atol=1e-3)
+    assert np.allclose(fast_value, value, atol=1e-3)
+
+
+class _CountingSampler(SobolQMCNormalSampler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def forward(self, posterior):
+        self.calls += 1
+        return super().forward(posterior)
+
+
+def test_qMaxVariance_closed_form():
+    """For a single point, the closed form sigma * sqrt(2 / pi) matches the
+    Monte Carlo estimate it replaces, and pending points still go through
+    sampling."""
+
+    model = _get_trained_model().model
+    X = torch.tensor([[0.1], [0.5], [0.9], [2.0]]).unsqueeze(1)
+
+    sampler = _CountingSampler(num_samples=4096, seed=123)
+    closed = _qMaxVariance(model, sampler=sampler)
+    mc = _qMaxVariance(
+        model,
+        sampler=SobolQMCNormalSampler(num_samples=4096, seed=123),
+        objective=GenericMCObjective(lambda samples, X=None: samples[..., 0]),
+    )
+
+    with torch.no_grad():
+        expected = mc(X)
+        assert np.allclose(closed(X), expected, rtol=0.05)
+        assert sampler.calls == 0
+
+        closed.set_X_pending(torch.tensor([[0.25]]))
+        closed(X)
+        assert sampler.calls == 1
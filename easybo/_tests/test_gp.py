@@ -1,12 +1,17 @@
 import numpy as np
+import pytest
+import torch
 
 from easybo.gp import EasySingleTaskGPRegressor
 from easybo.utils import get_dummy_1d_sinusoidal_data
 
 
-def test_gp_scaling():
+@pytest.mark.parametrize("eval_mode_first", [False, True])
+def test_gp_scaling(eval_mode_first):
     """Makes sure that accessing model.train_x and model.train_y works properly
-    with all of the transforms that botorch does under the hood."""
+    with all of the transforms that botorch does under the hood. The training
+    data is cached on first access, so that first access is done in either
+    train or eval mode, which (un)transform the data differently."""
 
     grid, train_x, train_y = get_dummy_1d_sinusoidal_data()
 
@@ -15,6 +20,10 @@ def test_gp_scaling():
     train_x = train_x * 10.0
     grid = grid * 10.0
 
+    modes = [True, False]  # Arguments to model.train(...)
+    if eval_mode_first:
+        modes = modes[::-1]
+
     model = EasySingleTaskGPRegressor(
         train_x=train_x,
         train_y=train_y,
@@ -22,23 +31,17 @@ def test_gp_scaling():
         standardize_outputs=True,
     )
 
-    model.model.train()
-    assert np.allclose(train_x, model.train_x)
-    assert np.allclose(train_y, model.train_y)
-
-    model.model.eval()
-    assert np.allclose(train_x, model.train_x)
-    assert np.allclose(train_y, model.train_y)
+    for mode in modes:
+        model.model.train(mode)
+        assert np.allclose(train_x, model.train_x)
+        assert np.allclose(train_y, model.train_y)
 
     model.train_()
 
-    model.model.train()
-    assert np.allclose(train_x, model.train_x)
-    assert np.allclose(train_y, model.train_y)
-
-    model.model.eval()
-    assert np.allclose(train_x, model.train_x)
-    assert np.allclose(train_y, model.train_y)
+    for mode in modes:
+        model.model.train(mode)
+        assert np.allclose(train_x, model.train_x)
+        assert np.allclose(train_y, model.train_y)
 
     new_x = np.array([2.25, 2.50]).reshape(-1, 1) * 10
     new_y = np.array([1, 2]).reshape(-1, 1) * 100
@@ -47,20 +50,70 @@ def test_gp_scaling():
     train_x = np.concatenate([train_x, new_x], axis=0)
     train_y = np.concatenate([train_y, new_y], axis=0)
 
-    new_model.model.train()
-    assert np.allclose(train_x, new_model.train_x)
-    assert np.allclose(train_y, new_model.train_y)
-
-    new_model.model.eval()
-    assert np.allclose(train_x, new_model.train_x)
-    assert np.allclose(train_y, new_model.train_y)
+    for mode in modes:
+        new_model.model.train(mode)
+        assert np.allclose(train_x, new_model.train_x)
+        assert np.allclose(train_y, new_model.train_y)
 
     new_model.train_()
 
-    new_model.model.train()
-    assert np.allclose(train_x, new_model.train_x)
-    assert np.allclose(train_y, new_model.train_y)
+    for mode in modes:
+        new_model.model.train(mode)
+        assert np.allclose(train_x, new_model.train_x)
+        assert np.allclose(train_y, new_model.train_y)
+
+
+def test_gp_default_modules_not_shared():
+    """The default likelihood, mean and kernel modules are shared between
+    every instance, so each model must get its own copy: training one model
+    must not change another."""
+
+    _, train_x, train_y = get_dummy_1d_sinusoidal_data()
+    model = EasySingleTaskGPRegressor(train_x=train_x, train_y=train_y)
+    other = EasySingleTaskGPRegressor(train_x=train_x, train_y=train_y)
+    assert model.model.covar_module is not other.model.covar_module
+
+    before = {k: v.clone() for k, v in other.model.state_dict().items()}
+    model.train_()
+
+    # Make sure training actually did something
+    trained = model.model.state_dict()
+    assert any(not torch.equal(v, trained[k]) for k, v in before.items())
+
+    for key, value in other.model.state_dict().items():
+        assert torch.equal(value, before[key])
+
+
+def test_gp_train_data_cached():
+    """The numpy training data is computed once and cannot be modified in
+    place, since it is shared between calls."""
+
+    _, train_x, train_y = get_dummy_1d_sinusoidal_data()
+    model = EasySingleTaskGPRegressor(train_x=train_x, train_y=train_y)
+
+    assert model.train_x is model.train_x
+    assert model.train_y is model.train_y
+
+    with pytest.raises(ValueError):
+        model.train_x[0, 0] = 1.0
+    with pytest.raises(ValueError):
+        model.train_y[0, 0] = 1.0
+
+
+def test_gp_dream_forwards_training_kwargs(monkeypatch):
+    """dream(...) passes its keyword arguments, and only those, on to the
+    training procedure of the dreamed model."""
+
+    _, train_x, train_y = get_dummy_1d_sinusoidal_data()
+    model = EasySingleTaskGPRegressor(train_x=train_x, train_y=train_y)
+
+    received = []
+
+    def train_(self, **kwargs):
+        received.append(kwargs)
+
+    monkeypatch.setattr(EasySingleTaskGPRegressor, "train_", train_)
 
-    new_model.model.eval()
-    assert np.allclose(train_x, new_model.train_x)
-    assert np.allclose(train_y, new_model.train_y)
+    optimizer_kwargs = {"options": {"maxiter": 5}}
+    model.dream(points_per_dimension=5, optimizer_kwargs=optimizer_kwargs)
+    assert received == [{"optimizer_kwargs": optimizer_kwargs}]
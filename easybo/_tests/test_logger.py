@@ -0,0 +1,11 @@
+from easybo.logger import _debug_enabled, logging_mode
+
+
+def test_debug_enabled():
+    """_debug_enabled follows the logging style: off by default, on while in
+    a debug logging mode, and off again afterwards."""
+
+    assert not _debug_enabled()
+    with logging_mode(debug=True):
+        assert _debug_enabled()
+    assert not _debug_enabled()
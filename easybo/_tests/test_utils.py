@@ -0,0 +1,32 @@
+import numpy as np
+import torch
+
+from easybo.utils import _to_float64_tensor
+
+
+def test_to_float64_tensor_copy():
+    """Tensors that are already correct are only copied when asked to, and
+    numpy arrays (even read-only ones) are converted either way."""
+
+    x = torch.ones(5, 2, dtype=torch.float64)
+    assert _to_float64_tensor(x, device="cpu", copy=False) is x
+    assert _to_float64_tensor(x, device="cpu") is not x
+
+    x = np.ones((5, 2), dtype=np.float32)
+    x.flags.writeable = False
+    for copy in [True, False]:
+        t = _to_float64_tensor(x, device="cpu", copy=copy)
+        assert t.dtype == torch.float64
+        assert np.allclose(t.numpy(), x)
+
+
+def test_to_float64_tensor_unusual_layouts():
+    """Arrays torch.from_numpy can't share memory with (negative strides,
+    non-native byte order) are copied even when no copy is requested."""
+
+    grid = np.linspace(0, 1, 10).reshape(-1, 1)
+    for x in [grid[::-1], np.flip(grid), grid.astype(">f8")]:
+        for copy in [True, False]:
+            t = _to_float64_tensor(x, device="cpu", copy=copy)
+            assert t.dtype == torch.float64
+            assert np.allclose(t.numpy(), x)
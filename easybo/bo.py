@@ -1,18 +1,23 @@
+from math import pi, sqrt
+
 import botorch  # noqa
 from botorch.acquisition import UpperConfidenceBound, ExpectedImprovement
 from botorch.acquisition.analytic import AnalyticAcquisitionFunction
 from botorch.acquisition.monte_carlo import MCAcquisitionFunction
+from botorch.acquisition.objective import IdentityMCObjective
 from botorch.acquisition.penalized import PenalizedAcquisitionFunction
 from botorch.optim import optimize_acqf
+from botorch.sampling import SobolQMCNormalSampler
 from botorch.utils.transforms import (
     t_batch_mode_transform,
     concatenate_pending_points,
 )
 
+import gpytorch
 import torch
 
-from easybo.utils import _to_float32_tensor, DEVICE
-from easybo.logger import logger, _log_warnings
+from easybo.utils import _to_float64_tensor, DEVICE
+from easybo.logger import logger, _log_warnings, _debug_enabled
 from easybo.gp import EasyGP
 
 
@@ -29,11 +34,14 @@ class _MaxVariance(AnalyticAcquisitionFunction):
         posterior = self.model.posterior(
             X=X, posterior_transform=self.posterior_transform
         )
-        mean = posterior.mean
+        # Only the variance is returned, so take the shape from it directly
+        variance = posterior.variance
         view_shape = (
-            mean.shape[:-2] if mean.shape[-2] == 1 else mean.shape[:-1]
+            variance.shape[:-2]
+            if variance.shape[-2] == 1
+            else variance.shape[:-1]
         )
-        return posterior.variance.view(view_shape)
+        return variance.view(view_shape)
 
 
 class _qMaxVariance(MCAcquisitionFunction):
@@ -44,7 +52,17 @@ class _qMaxVariance(MCAcquisitionFunction):
         objective=None,
         posterior_transform=None,
         X_pending=None,
+        num_samples=512,
+        seed=None,
     ):
+        # The sampler draws its base samples once and reuses them for every
+        # evaluation (as long as the shape of X does not change), which keeps
+        # the acquisition surface deterministic during optimization. A seed
+        # makes the acquisition values reproducible; reproducible candidates
+        # from ask also require seeding torch (e.g. torch.manual_seed), which
+        # optimize_acqf uses to draw its raw samples.
+        if sampler is None:
+            sampler = SobolQMCNormalSampler(num_samples=num_samples, seed=seed)
         super().__init__(
             model=model,
             sampler=sampler,
@@ -59,6 +77,16 @@ class _qMaxVariance(MCAcquisitionFunction):
         posterior = self.model.posterior(
             X=X, posterior_transform=self.posterior_transform
         )
+
+        # For a single point and output, the expected absolute deviation from
+        # the mean is known in closed form, sigma * sqrt(2 / pi), so there is
+        # no need to sample. Note X_pending has already been concatenated.
+        single = X.shape[-2] == 1
+        if single and isinstance(self.objective, IdentityMCObjective):
+            variance = posterior.variance
+            if variance.shape[-1] == 1:
+                return variance.sqrt().view(X.shape[:-2]) * sqrt(2.0 / pi)
+
         samples = self.sampler(posterior)
         obj = self.objective(samples, X=X)
         mean = obj.mean(dim=0)
@@ -89,6 +117,7 @@ def ask(
     penalty_function=None,
     penalty_strength=0.1,
     terminate_on_fail=True,
+    fast_pred_var=True,
     device=DEVICE,
 ):
     """Asks the model to sample the next point(s) based on the current state
@@ -127,6 +156,14 @@ def ask(
         the value of this function, the less that point is favored.
     penalty_strength : float, optional
         The strength of the penalty regularization.
+    fast_pred_var : bool, optional
+        If True, the acquisition function is optimized under
+        ``gpytorch.settings.fast_pred_var``, so that the predictive variance
+        cache computed during the first evaluation is reused by all of the
+        subsequent ones. Note that the variances are then approximate (LOVE)
+        once the number of training points exceeds GPyTorch's
+        ``max_root_decomposition_size`` (100 by default), which can change
+        the suggested points. Set to False to use exact variances.
     device : str
         The device on which to place any arrays passed to ``ask``.
 
@@ -141,11 +178,14 @@ def ask(
         If an incorrect acqusition function name is provided.
     """
 
-    logger.debug(f"ask queried with args: {locals()}")
+    # Formatting the locals means formatting the whole model
+    if _debug_enabled():
+        logger.debug(f"ask queried with args: {locals()}")
 
     dims = len(bounds[0])
-    bounds = torch.tensor(bounds).float().reshape(-1, 2).T
-    logger.debug(f"ask bounds set to {bounds}")
+    bounds = torch.tensor(bounds).double().reshape(-1, 2).T
+    if _debug_enabled():
+        logger.debug(f"ask bounds set to {bounds}")
 
     if isinstance(model, EasyGP):
         model = model.model
@@ -154,8 +194,8 @@ def ask(
     if isinstance(acquisition_function, str):
 
         try:
-            acquisition_function = eval(
-                f"botorch.acquisition.{acquisition_function}"
+            acquisition_function = getattr(
+                botorch.acquisition, acquisition_function
             )
 
         # Custom definitions
@@ -180,7 +220,7 @@ def ask(
     )
 
     if X_pending is not None:
-        X_pending = _to_float32_tensor(X_pending, device=device)
+        X_pending = _to_float64_tensor(X_pending, device=device, copy=False)
 
     aq = acquisition_function(
         model,
@@ -206,15 +246,17 @@ def ask(
             aq, penalty_function, penalty_strength
         )
 
-    candidate, acq_value = optimize_acqf(
-        aq,
-        bounds=bounds,
-        fixed_features=fixed_features,
-        **optimize_acqf_kwargs,
-    )
+    with gpytorch.settings.fast_pred_var(fast_pred_var):
+        candidate, acq_value = optimize_acqf(
+            aq,
+            bounds=bounds,
+            fixed_features=fixed_features,
+            **optimize_acqf_kwargs,
+        )
 
-    logger.debug(f"candidates: {candidate}")
-    logger.debug(f"acquisition function value: {acq_value}")
+    if _debug_enabled():
+        logger.debug(f"candidates: {candidate}")
+        logger.debug(f"acquisition function value: {acq_value}")
     return candidate
 
 
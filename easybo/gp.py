@@ -20,8 +20,8 @@ from linear_operator.utils.errors import NotPSDError
 import numpy as np
 import torch
 
-from easybo.utils import _to_float32_tensor, DEVICE, Timer
-from easybo.logger import logger, _log_warnings
+from easybo.utils import _to_float64_tensor, DEVICE, Timer
+from easybo.logger import logger, _log_warnings, _debug_enabled
 
 
 _TRAINING_WARN_MESSAGE = (
@@ -61,6 +61,12 @@ class EasyGP:
 
     def __init__(self):
         self._training_state_successful = False
+        self._train_x_numpy = None
+        self._train_y_numpy = None
+
+    def _reset_train_data_cache(self):
+        self._train_x_numpy = None
+        self._train_y_numpy = None
 
     @property
     def training_state_successful(self):
@@ -76,7 +82,7 @@ class EasyGP:
 
     def x_to_tensor(self, x):
         """Executes a forward transformation of some sort on the input data.
-        This defaults to a simple conversion to a float32 tensor and placing
+        This defaults to a simple conversion to a float64 tensor and placing
         that object on the correct device.
 
         Parameters
@@ -88,11 +94,11 @@ class EasyGP:
         torch.tensor
         """
 
-        return _to_float32_tensor(x, device=self.device)
+        return _to_float64_tensor(x, device=self.device)
 
     def y_to_tensor(self, y):
         """Executes a forward transformation of some sort on the output data.
-        This defaults to a simple conversion to a float32 tensor and placing
+        This defaults to a simple conversion to a float64 tensor and placing
         that object on the correct device.
 
         Parameters
@@ -104,7 +110,7 @@ class EasyGP:
         torch.tensor
         """
 
-        return _to_float32_tensor(y, device=self.device)
+        return _to_float64_tensor(y, device=self.device)
 
     @property
     def device(self):
@@ -157,7 +163,9 @@ class EasyGP:
         return self._model
 
     def _get_current_train_x(self, untransform=False):
-        x = deepcopy(self._model.train_inputs[0])
+        # Note that this is not a copy unless untransformed: don't modify it
+        # in place
+        x = self._model.train_inputs[0]
         if untransform and hasattr(self._model, "input_transform"):
             x = self._model.input_transform.untransform(x)
         return x
@@ -166,19 +174,26 @@ class EasyGP:
     def train_x(self):
         """The training inputs. Should be of shape ``N_train x d_in``. This
         also unscales the data if the ``input_transform`` attribute is present
-        in the model.
+        in the model. The array is cached and read-only; copy it if you need
+        to modify it.
 
         Returns
         -------
         numpy.ndarray
         """
 
-        # github.com/pytorch/botorch/issues/1435#issuecomment-1274974582
-        t = self._model.training
-        return self._get_current_train_x(untransform=not t).detach().numpy()
+        if self._train_x_numpy is None:
+            # github.com/pytorch/botorch/issues/1435#issuecomment-1274974582
+            t = self._model.training
+            x = self._get_current_train_x(untransform=not t)
+            x = x.detach().cpu().numpy().copy()
+            x.flags.writeable = False
+            self._train_x_numpy = x
+        return self._train_x_numpy
 
     def _get_current_train_y(self, untransform=False):
-        y = deepcopy(self._model.train_targets.reshape(-1, 1))
+        # Same as for x, this is a view of the training targets
+        y = self._model.train_targets.reshape(-1, 1)
         if untransform and hasattr(self._model, "outcome_transform"):
             y, _ = self._model.outcome_transform.untransform(y)
         return y
@@ -188,14 +203,20 @@ class EasyGP:
         """The training targets. Should be of shape ``N_train x d_out``. Note
         that for classification, these should be one-hot encoded, e.g.
         ``np.array([0, 1, 2, 1, 2, 0, 0])``. This also unscales the data if
-        the ``outcomes_transform`` attribute is present in the model.
+        the ``outcomes_transform`` attribute is present in the model. The
+        array is cached and read-only; copy it if you need to modify it.
 
         Returns
         -------
         numpy.ndarray
         """
 
-        return self._get_current_train_y(untransform=True).detach().numpy()
+        if self._train_y_numpy is None:
+            y = self._get_current_train_y(untransform=True)
+            y = y.detach().cpu().numpy().copy()
+            y.flags.writeable = False
+            self._train_y_numpy = y
+        return self._train_y_numpy
 
     def _get_training_debug_information(self, model=None):
         if model is None:
@@ -219,6 +240,11 @@ class EasyGP:
         return info
 
     def _log_training_debug_information(self, model=None):
+        # Stringifying every parameter forces each tensor to be materialized,
+        # so don't bother unless someone is going to read it
+        if not _debug_enabled():
+            return
+
         info = self._get_training_debug_information(model=model)
         for p in info["hyperparameters"]:
             logger.debug(p)
@@ -231,10 +257,11 @@ class EasyGP:
 
     def _get_posterior(self, grid, observation_noise=True):
 
+        # The likelihood is a submodule of the model, so this also puts it in
+        # eval mode
         self._model.eval()
-        self._model.likelihood.eval()
 
-        grid = _to_float32_tensor(grid, device=self.device)
+        grid = _to_float64_tensor(grid, device=self.device, copy=False)
 
         with torch.no_grad(), gpytorch.settings.fast_pred_var():
             return self._model.posterior(
@@ -252,13 +279,16 @@ class EasyGP:
             If None, uses ``self.train_y``.
         """
 
+        # Stay in torch when using the training data, there's no reason to
+        # make a roundtrip through numpy
         if train_x is None:
-            train_x = self.train_x
-        train_x = _to_float32_tensor(train_x)
+            t = self._model.training
+            train_x = self._get_current_train_x(untransform=not t)
+        train_x = _to_float64_tensor(train_x, device=self.device, copy=False)
 
         if train_y is None:
-            train_y = self.train_y
-        train_y = _to_float32_tensor(train_y)
+            train_y = self._get_current_train_y(untransform=True)
+        train_y = _to_float64_tensor(train_y, device=self.device, copy=False)
 
         posterior = self._get_posterior(train_x, observation_noise=True)
         try:
@@ -279,12 +309,18 @@ class EasyGP:
     ):
         """Trains model. This is a lightweight wrapper for ``botorch``'s
         ``fit_gpytorch_mll`` function. It simply initializes an
-        exact marginal log likelihood and uses that to train the model.
+        exact marginal log likelihood and uses that to train the model. By
+        default, the hyperparameters are fit using scipy's L-BFGS-B, which
+        usually converges in far fewer iterations than first-order methods
+        such as Adam.
 
         Parameters
         ----------
-        optimizer : torch.optim, optional
-            The optimizer to use to train the GP.
+        optimizer : callable, optional
+            The optimization routine to use to train the GP. If None, defaults
+            to ``botorch.optim.fit.fit_gpytorch_scipy`` (L-BFGS-B). Use
+            ``botorch.optim.fit.fit_gpytorch_torch`` for a ``torch.optim``
+            based optimizer instead.
         optimizer_kwargs : dict, optional
             Keyword arguments to pass to the optimizer.
         **kwargs
@@ -293,6 +329,10 @@ class EasyGP:
 
         self._training_state_successful = True
 
+        # Training can update the transforms' state, so don't trust anything
+        # computed with the old one
+        self._reset_train_data_cache()
+
         logger.debug("------- PARAMETER INFO BEFORE TRAINING -------")
         self._log_training_debug_information()
 
@@ -375,8 +415,15 @@ class EasyGP:
             grid, observation_noise=observation_noise
         )
 
-        mean = posterior.mean.detach().numpy().squeeze()
-        std = np.sqrt(posterior.variance.detach().numpy().squeeze())
+        # The diagonal of the predictive covariance (test-test kernel
+        # diagonal plus noise) is only evaluated when the variance is read,
+        # so do that under no_grad as well
+        with torch.no_grad():
+            mean = posterior.mean
+            std = posterior.variance.sqrt()
+
+        mean = mean.cpu().numpy().squeeze()
+        std = std.cpu().numpy().squeeze()
 
         if not self._training_state_successful:
             logger.warning(_TRAINING_WARN_MESSAGE)
@@ -411,17 +458,22 @@ class EasyGP:
         if seed is not None:
             torch.manual_seed(seed)
         posterior = self._get_posterior(grid)
-        sampled = posterior.sample(torch.Size([samples]))
-        return sampled.detach().numpy().reshape(samples, len(grid))
+
+        # All samples are drawn in one batched call; doing so outside of
+        # no_grad would also build the autograd graph through the Cholesky
+        with torch.no_grad():
+            sampled = posterior.sample(torch.Size([samples]))
+        return sampled.cpu().numpy().reshape(samples, len(grid))
 
     def _condition(self, new_x, new_y):
 
         # Concatenate all of the untransformed data together
         x = self._get_current_train_x(untransform=True)
-        logger.debug(f"old_x min max: {x.min(axis=0)} {x.max(axis=0)}")
-        x = torch.cat([x, new_x], axis=0)
         y = self._get_current_train_y(untransform=True)
-        logger.debug(f"old_y min max: {y.min(axis=0)} {y.max(axis=0)}")
+        if _debug_enabled():
+            logger.debug(f"old_x min max: {x.min(axis=0)} {x.max(axis=0)}")
+            logger.debug(f"old_y min max: {y.min(axis=0)} {y.max(axis=0)}")
+        x = torch.cat([x, new_x], axis=0)
         y = torch.cat([y, new_y], axis=0)
 
         # Get the model's state dict. This contains all of the state
@@ -496,8 +548,13 @@ class EasyGP:
         new_x = self.x_to_tensor(new_x)
         new_y = self.y_to_tensor(new_y)
 
-        logger.debug(f"new_x min max {new_x.min(axis=0)} {new_x.max(axis=0)}")
-        logger.debug(f"new_y min max {new_y.min(axis=0)} {new_y.max(axis=0)}")
+        if _debug_enabled():
+            logger.debug(
+                f"new_x min max {new_x.min(axis=0)} {new_x.max(axis=0)}"
+            )
+            logger.debug(
+                f"new_y min max {new_y.min(axis=0)} {new_y.max(axis=0)}"
+            )
 
         # try:
         #     self._model = self._model.condition_on_observations(new_x, new_y)
@@ -561,12 +618,12 @@ class EasyGP:
             -1, self.train_y.shape[1]
         )
 
-        kwargs = deepcopy(self._initial_kwargs)
-        kwargs["train_x"] = coordinates
-        kwargs["train_y"] = y
+        model_kwargs = deepcopy(self._initial_kwargs)
+        model_kwargs["train_x"] = coordinates
+        model_kwargs["train_y"] = y
 
         # Initialize and train...
-        new_model = self.__class__(**kwargs)
+        new_model = self.__class__(**model_kwargs)
         new_model.train_(**kwargs)
 
         return new_model
@@ -611,17 +668,21 @@ class EasySingleTaskGPRegressor(EasyGP):
         )
         m = train_y.shape[1]  # Number of targets
         outcome_transform = Standardize(m) if standardize_outputs else None
+
+        # The default modules are shared between every instance, so each
+        # model needs its own copy of them. Copying just these is much cheaper
+        # than copying the entire model after it has been constructed.
         model = SingleTaskGP(
             train_X=self.x_to_tensor(train_x),
             train_Y=self.y_to_tensor(train_y),
-            likelihood=likelihood,
-            mean_module=mean_module,
-            covar_module=covar_module,
+            likelihood=deepcopy(likelihood),
+            mean_module=deepcopy(mean_module),
+            covar_module=deepcopy(covar_module),
             input_transform=input_transform,
             outcome_transform=outcome_transform,
             **kwargs,
         )
-        self._model = deepcopy(model.to(device))
+        self._model = model.to(device)
 
 
 # class MostLikelyHeteroskedasticGPRegressor(EasyGP):
@@ -52,6 +52,7 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["DEBUG"]),
+            level="DEBUG",
             format=SIMPLE_LOGGER_FMT if debug_simple else LOGGER_FMT,
         )
 
@@ -60,6 +61,7 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["INFO"]),
+            level="INFO",
             format=SIMPLE_LOGGER_FMT if info_simple else LOGGER_FMT,
         )
 
@@ -68,6 +70,7 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["SUCCESS"]),
+            level="SUCCESS",
             format=SIMPLE_LOGGER_FMT if success_simple else LOGGER_FMT,
         )
 
@@ -76,6 +79,7 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["WARNING"]),
+            level="WARNING",
             format=SIMPLE_LOGGER_FMT if warning_simple else LOGGER_FMT,
         )
 
@@ -84,6 +88,7 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["ERROR"]),
+            level="ERROR",
             format=SIMPLE_LOGGER_FMT if error_simple else LOGGER_FMT,
         )
 
@@ -92,10 +97,24 @@ def set_logger_style(
             sys.stdout,
             colorize=True,
             filter=generic_filter(["CRITICAL"]),
+            level="CRITICAL",
             format=SIMPLE_LOGGER_FMT if critical_simple else LOGGER_FMT,
         )
 
 
+def _debug_enabled():
+    """Checks whether any sink will actually emit DEBUG messages. Useful for
+    skipping expensive string formatting (or tensor reductions) that are only
+    ever needed for debug logging.
+
+    Returns
+    -------
+    bool
+    """
+
+    return logger._core.min_level <= logger.level("DEBUG").no
+
+
 def _log_warnings(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
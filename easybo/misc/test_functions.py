@@ -27,7 +27,7 @@ def get_1d_features(seed=127, N=1000, Nsmall=15, xmin=-20.0, xmax=50.0):
     """
 
     np.random.seed(seed)
-    idx = np.random.choice([xx for xx in range(N)], Nsmall, replace=False)
+    idx = np.random.choice(N, Nsmall, replace=False)
     idx.sort()
     grid = np.linspace(xmin, xmax, N)
     X = grid[idx]
@@ -31,17 +31,27 @@ class Timer:
         return self._units
 
 
-def _to_float32_tensor(x, device=DEVICE):
+def _to_float64_tensor(x, device=DEVICE, copy=True):
 
     if x is None:
         return None
 
     if isinstance(x, np.ndarray):
-        x = torch.tensor(x.copy()).double()
-
-    x = x.clone().double()
-    x = x.to(device)
-    return x
+        # torch.from_numpy cannot handle negative strides or non-native byte
+        # order, and warns on read-only arrays, so copy in those cases too
+        if (
+            copy
+            or not x.flags.writeable
+            or any(s < 0 for s in x.strides)
+            or not x.dtype.isnative
+        ):
+            x = np.array(x, dtype=np.float64, order="C")
+            copy = False
+        x = torch.from_numpy(x)
+
+    # Unless a copy is requested, this is a no-op if x is already a float64
+    # tensor on the correct device
+    return x.to(device=device, dtype=torch.float64, copy=copy)
 
 
 def _to_long_tensor(x, device=DEVICE):
@@ -100,7 +110,7 @@ def get_dummy_1d_sinusoidal_data(seed=123):
 def get_dummy_2d_data(seed=127, N=100, M=150):
 
     np.random.seed(seed)
-    idx = np.random.choice([xx for xx in range(N * M)], 20, replace=False)
+    idx = np.random.choice(N * M, 20, replace=False)
     idx.sort()
 
     grid_x = np.linspace(-4, 5, N)